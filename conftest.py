@@ -0,0 +1,2 @@
+# Having a conftest.py at the repo root makes pytest add this directory to
+# sys.path, so tests/test_main.py can import main no matter how pytest is invoked.
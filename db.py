@@ -3,21 +3,32 @@ from pymongo.collection import Collection
 from pymongo.database import Database
 
 
-mongo_client = pymongo.MongoClient("mongodb://localhost:27017/")
+# The one MongoClient for the whole process: each client starts its own
+# topology-monitoring thread and connection pool, so creating more wastes both.
+mongo_client = pymongo.MongoClient(
+    "mongodb://localhost:27017/", maxPoolSize=50, minPoolSize=10
+)
 db: Database = mongo_client["mydatabase"]
 jobs_collection: Collection = db["jobs"]
 frames_collection: Collection = db["frames"]
 
 
+def ensure_frames_indexes():
+    """Creates the indexes the exports' and questions' queries need."""
+    frames_collection.create_index([("is_range", 1), ("end_frame", 1)])
+    # Covers questions.py's lookups by user and by user + date.
+    frames_collection.create_index([("user_on_file", 1), ("file_date", 1)])
+
+
 def print_db():
     print("collections: ", db.list_collection_names())
 
     print("\njobs collection:")
-    for x in jobs_collection.find():
+    for x in jobs_collection.find({}, {"_id": 0}).limit(10):
         print(x)
 
     print("\nframes collection:")
-    for x in frames_collection.find():
+    for x in frames_collection.find({}, {"_id": 0}).limit(10):
         print(x)
 
 
@@ -26,5 +37,6 @@ def clear_db():
     frames_collection.drop()
 
 
-# clear_db()
-print_db()
+if __name__ == "__main__":
+    # clear_db()
+    print_db()
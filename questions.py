@@ -5,6 +5,7 @@
 3. What work done on hpsans13 on date 3-26-2023
 4. Name of all Autodesk Flame users
 """
+import re
 from datetime import datetime
 
 import pymongo
@@ -13,6 +14,15 @@ from pymongo.cursor import Cursor
 from pymongo.database import Database
 
 
+# Every query here only reads these two fields, so the projection keeps the rest
+# of each document off the wire.
+_LOCATION_AND_FRAME_RANGE = {"location": 1, "frame_range": 1, "_id": 0}
+
+# Captures the user name from work file names like "Flame_DFlowers_20230323.txt",
+# ignoring any leading directories (either slash style).
+_USER_PATTERN = re.compile(r"[^/\\]*_([^_]+)_[^_]+\.[^.]+$")
+
+
 def main():
     mongo_client = pymongo.MongoClient("mongodb://localhost:27017/")
     db: Database = mongo_client["mydatabase"]
@@ -53,30 +63,25 @@ def get_work_by_user(
     user_name: str, frames_collection: Collection
 ) -> list[tuple[str, list[str]]]:
     """Returns the location and frame numbers of work done by a user."""
-    cursor: Cursor = frames_collection.find({"user_on_file": user_name})
-    locations: list[str] = []
-    frame_ranges: list[list[str]] = []
-    for item in cursor:
-        locations.append(item["location"])
-        frame_ranges.append(item["frame_range"])
-    return list(zip(locations, frame_ranges))
+    cursor: Cursor = frames_collection.find(
+        {"user_on_file": user_name}, _LOCATION_AND_FRAME_RANGE
+    ).batch_size(1000)
+    return [(item["location"], item["frame_range"]) for item in cursor]
 
 
 def get_work_before_date(
     date: datetime, work_file_path: str, frames_collection: Collection
 ) -> list[tuple[str, list[str]]]:
     """Returns the location and frame numbers of work done before a date on a file."""
-    work_file_path = work_file_path.replace("\\", "/")
-    _, user_on_file, _ = work_file_path.split("/")[-1].split(".")[0].split("_")
+    match = _USER_PATTERN.search(work_file_path)
+    if match is None:
+        raise ValueError(f"Error: no user name found in {work_file_path}")
+    user_on_file = match.group(1)
     cursor: Cursor = frames_collection.find(
-        {"user_on_file": user_on_file, "file_date": {"$lt": date}}
-    )
-    locations: list[str] = []
-    frame_ranges: list[list[str]] = []
-    for item in cursor:
-        locations.append(item["location"])
-        frame_ranges.append(item["frame_range"])
-    return list(zip(locations, frame_ranges))
+        {"user_on_file": user_on_file, "file_date": {"$lt": date}},
+        _LOCATION_AND_FRAME_RANGE,
+    ).batch_size(1000)
+    return [(item["location"], item["frame_range"]) for item in cursor]
 
 
 def get_work_on_date_by_user(
@@ -84,14 +89,9 @@ def get_work_on_date_by_user(
 ) -> list[tuple[str, list[str]]]:
     """Returns the location and frame numbers of work done on a date by a user."""
     cursor: Cursor = frames_collection.find(
-        {"user_on_file": user_name, "file_date": date}
-    )
-    locations: list[str] = []
-    frame_ranges: list[list[str]] = []
-    for item in cursor:
-        locations.append(item["location"])
-        frame_ranges.append(item["frame_range"])
-    return list(zip(locations, frame_ranges))
+        {"user_on_file": user_name, "file_date": date}, _LOCATION_AND_FRAME_RANGE
+    ).batch_size(1000)
+    return [(item["location"], item["frame_range"]) for item in cursor]
 
 
 def get_flame_users(flame_file_paths: list[str]) -> list[str]:
@@ -99,12 +99,9 @@ def get_flame_users(flame_file_paths: list[str]) -> list[str]:
 
     Removes duplicates.
     """
-    names: list[str] = []
-    for path in flame_file_paths:
-        name = path.split("_")[1]
-        if name not in names:
-            names.append(name)
-    return names
+    # dict.fromkeys dedupes in O(n) while keeping first-seen order, unlike the
+    # O(n^2) list-membership approach.
+    return list(dict.fromkeys(path.split("_")[1] for path in flame_file_paths))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,265 @@
+from textwrap import dedent
+
+import pytest
+
+from main import build_xytech_path_trie
+from main import clean_numbers
+from main import find_xytech_path
+from main import get_field
+from main import get_file_date
+from main import get_frame_ranges
+from main import get_frame_ranges_numpy
+from main import get_thumbnail_size
+from main import load_xytech_data
+from main import reversed_common_path
+from main import split_baselight_line
+from main import split_flame_line
+from main import tokens_to_frame_range_pairs
+
+
+def test_load_xytech_data() -> None:
+    assert (
+        load_xytech_data(
+            dedent(
+                """
+                Xytech Workorder 1107
+
+                Producer: Joan Jett
+                Operator: John Doe
+                Job: Dirtfixing
+
+
+                Location:
+                /hpsans13/production/starwars/reel1/partA/1920x1080
+                /hpsans12/production/starwars/reel1/VFX/Hydraulx
+                /hpsans13/production/starwars/reel1/VFX/Framestore
+                /hpsans14/production/starwars/reel1/VFX/AnimalLogic
+                /hpsans13/production/starwars/reel1/partB/1920x1080
+                /hpsans15/production/starwars/pickups/shot_1ab/1920x1080
+
+
+                Notes:
+                Please clean files noted per Colorist Tom Brady
+                """
+            )
+        )
+        == (
+            "Joan Jett",
+            "John Doe",
+            "Dirtfixing",
+            "Please clean files noted per Colorist Tom Brady",
+            [
+                "/hpsans13/production/starwars/reel1/partA/1920x1080",
+                "/hpsans12/production/starwars/reel1/VFX/Hydraulx",
+                "/hpsans13/production/starwars/reel1/VFX/Framestore",
+                "/hpsans14/production/starwars/reel1/VFX/AnimalLogic",
+                "/hpsans13/production/starwars/reel1/partB/1920x1080",
+                "/hpsans15/production/starwars/pickups/shot_1ab/1920x1080",
+            ],
+        )
+    )
+
+
+def test_get_field() -> None:
+    assert (
+        get_field("Producer", "Xytech Workorder 1107\n\nProducer: Joan Jett")
+        == "Joan Jett"
+    )
+
+
+def test_get_field_no_match() -> None:
+    with pytest.raises(ValueError):
+        get_field("Operator", "Xytech Workorder 3784\n\nProducer: Joan Jett")
+
+
+def test_reversed_common_path() -> None:
+    assert (
+        reversed_common_path(
+            [
+                "/images1/starwars/reel1/partA/1920x1080",
+                "/hpsans13/production/starwars/reel1/partA/1920x1080",
+            ]
+        )
+        == "/starwars/reel1/partA/1920x1080"
+    )
+
+
+def test_reversed_common_path_no_common_path() -> None:
+    assert (
+        reversed_common_path(
+            [
+                "/hpsans13/production/starwars/reel1/partA/1920x1080",
+                "/hpsans13/production/starwars/reel1/VFX/Hydraulx",
+            ]
+        )
+        == ""
+    )
+
+
+def test_reversed_common_path_partial_common_path() -> None:
+    assert (
+        reversed_common_path(
+            [
+                "/images1/starwars/reel1/partA/1920x1080",
+                "/images1/starwars/reel1/partB/1920x1080",
+            ]
+        )
+        == "/1920x1080"
+    )
+
+
+def test_find_xytech_path() -> None:
+    xytech_paths: list[str] = [
+        "/hpsans13/production/starwars/reel1/partA/1920x1080",
+        "/hpsans12/production/starwars/reel1/VFX/Hydraulx",
+        "/hpsans13/production/starwars/reel1/partB/1920x1080",
+    ]
+    trie: dict = build_xytech_path_trie(xytech_paths)
+    assert (
+        find_xytech_path(trie, "/images1/starwars/reel1/partA/1920x1080")
+        == "/hpsans13/production/starwars/reel1/partA/1920x1080"
+    )
+    assert (
+        find_xytech_path(trie, "/images1/starwars/reel1/VFX/Hydraulx")
+        == "/hpsans12/production/starwars/reel1/VFX/Hydraulx"
+    )
+
+
+def test_find_xytech_path_no_match() -> None:
+    trie: dict = build_xytech_path_trie(
+        ["/hpsans13/production/starwars/reel1/partA/1920x1080"]
+    )
+    assert find_xytech_path(trie, "/images1/starwars/reel1/VFX/Hydraulx") is None
+
+
+def test_find_xytech_path_one_common_component_is_not_enough() -> None:
+    trie: dict = build_xytech_path_trie(
+        ["/hpsans13/production/starwars/reel1/partB/1920x1080"]
+    )
+    assert find_xytech_path(trie, "/images1/starwars/reel1/partA/1920x1080") is None
+
+
+def test_split_baselight_line() -> None:
+    assert split_baselight_line(
+        "/images1/starwars/reel1/VFX/Hydraulx 1251 1252 1253 1260 <err> 1270 1271 1272 "
+    ) == (
+        "/images1/starwars/reel1/VFX/Hydraulx",
+        ["1251", "1252", "1253", "1260", "<err>", "1270", "1271", "1272", ""],
+    )
+
+
+def test_split_baselight_line_no_frames() -> None:
+    assert split_baselight_line("/images1/starwars/reel1/VFX/Hydraulx") == (
+        "/images1/starwars/reel1/VFX/Hydraulx",
+        [],
+    )
+
+
+def test_split_baselight_line_path_with_spaces() -> None:
+    assert split_baselight_line(
+        "/images1/starwars/reel1/VFX/spaces and 3874 numbers 6188 6189 6190 6191"
+    ) == (
+        "/images1/starwars/reel1/VFX/spaces and 3874 numbers",
+        ["6188", "6189", "6190", "6191"],
+    )
+
+
+def test_split_baselight_line_with_windows_path() -> None:
+    assert split_baselight_line(
+        "C:\\images1\\starwars\\reel1\\VFX\\Hydraulx 1251 1252 1253 1260 <err> 1270 "
+    ) == (
+        "C:/images1/starwars/reel1/VFX/Hydraulx",
+        ["1251", "1252", "1253", "1260", "<err>", "1270", ""],
+    )
+
+
+def test_split_flame_line() -> None:
+    assert split_flame_line(
+        "/net/flame-archive Avatar/reel1/VFX/Hydraulx 1260 1261 1262 1267"
+    ) == (
+        "/net/flame-archive/Avatar/reel1/VFX/Hydraulx",
+        ["1260", "1261", "1262", "1267"],
+    )
+
+
+def test_split_flame_line_two_frames() -> None:
+    assert split_flame_line(
+        "/net/flame-archive Avatar/pickups/shot_5ab/1920x1080 9090 9091"
+    ) == (
+        "/net/flame-archive/Avatar/pickups/shot_5ab/1920x1080",
+        ["9090", "9091"],
+    )
+
+
+def test_split_flame_line_one_frame() -> None:
+    assert split_flame_line("/net/flame-archive Avatar/reel1/VFX/Framestore 6195") == (
+        "/net/flame-archive/Avatar/reel1/VFX/Framestore",
+        ["6195"],
+    )
+
+
+def test_clean_numbers() -> None:
+    assert clean_numbers(
+        ["1251", "1252", "<null>", "1253", "1260", "<err>", "1270", "1271", "1272", ""]
+    ) == [1251, 1252, 1253, 1260, 1270, 1271, 1272]
+
+
+def test_get_frame_ranges_continuous() -> None:
+    assert get_frame_ranges([1, 2, 3, 4, 5, 6]) == ["1-6"]
+
+
+def test_get_frame_ranges_discontinuous() -> None:
+    assert get_frame_ranges([1, 2, 3, 5, 6, 7]) == ["1-3", "5-7"]
+
+
+def test_get_frame_ranges_one_number() -> None:
+    assert get_frame_ranges([38]) == ["38"]
+
+
+def test_get_frame_ranges_two_numbers() -> None:
+    assert get_frame_ranges([1, 3]) == ["1", "3"]
+
+
+def test_get_thumbnail_size() -> None:
+    assert get_thumbnail_size(1920, 1080) == (96, 54)
+
+
+def test_get_thumbnail_size_tall_video() -> None:
+    assert get_thumbnail_size(1080, 1920) == (42, 74)
+
+
+def test_tokens_to_frame_range_pairs() -> None:
+    assert tokens_to_frame_range_pairs(
+        ["1251", "1252", "<null>", "1253", "1260", "<err>", "1270", "1271", ""]
+    ) == [(1251, 1253), (1260, 1260), (1270, 1271)]
+
+
+def test_tokens_to_frame_range_pairs_no_numbers() -> None:
+    assert tokens_to_frame_range_pairs(["<err>", ""]) == []
+
+
+def test_get_frame_ranges_numpy_path() -> None:
+    frame_numbers: list[int] = list(range(1, 2000)) + [2500]
+    assert get_frame_ranges(frame_numbers) == ["1-1999", "2500"]
+    assert get_frame_ranges_numpy(frame_numbers) == ["1-1999", "2500"]
+
+
+def test_get_frame_ranges_numpy_matches_pure_python() -> None:
+    frame_numbers: list[int] = [1, 2, 3, 5, 6, 7, 38, 40]
+    assert get_frame_ranges_numpy(frame_numbers) == get_frame_ranges(frame_numbers)
+
+
+def test_get_frame_ranges_numpy_no_numbers() -> None:
+    assert get_frame_ranges_numpy([]) == []
+
+
+def test_get_file_date_baselight() -> None:
+    assert get_file_date("Baselight_GLopez_20230325.txt") == "20230325"
+
+
+def test_get_file_date_flame() -> None:
+    assert get_file_date("Flame_DFlowers_20230323.txt") == "20230323"
+
+
+def test_get_file_date_xytech() -> None:
+    assert get_file_date("Xytech_20230323.txt") == "20230323"